@@ -95,3 +95,4 @@ CORS_ALLOWED_ORIGINS = [
 
 LLM_API_KEY = os.getenv('LLM_API_KEY', '')
 LLM_PROVIDER = os.getenv('LLM_PROVIDER', 'openai')
+LLM_API_BASE = os.getenv('LLM_API_BASE', '')
@@ -6,10 +6,23 @@ from typing import Tuple
 
 logger = logging.getLogger(__name__)
 
+# Default API roots for the REST-based providers; LLM_API_BASE overrides them
+# (e.g. to point at the fake provider in loadtest/ for offline load testing).
+# OpenAI is left to the SDK, which also honours OPENAI_API_BASE.
+DEFAULT_API_BASES = {
+    'anthropic': 'https://api.anthropic.com',
+    'gemini': 'https://generativelanguage.googleapis.com',
+}
+
 class LLMService:
     def __init__(self):
         self.api_key = os.getenv('LLM_API_KEY', '')
         self.provider = os.getenv('LLM_PROVIDER', 'openai')
+        self.api_base = os.getenv('LLM_API_BASE', '').rstrip('/')
+
+    def _api_base(self, provider: str) -> str:
+        """Return the API root for provider, honouring LLM_API_BASE"""
+        return self.api_base or DEFAULT_API_BASES[provider]
 
     def classify_ticket(self, description: str) -> Tuple[str, str]:
         """
@@ -42,6 +55,8 @@ class LLMService:
         try:
             import openai
             openai.api_key = self.api_key
+            if self.api_base:
+                openai.api_base = f"{self.api_base}/v1"
 
             prompt = f"""Analyze this support ticket description and classify it.
 
@@ -114,7 +129,7 @@ Guidelines:
             }
 
             response = requests.post(
-                "https://api.anthropic.com/v1/messages",
+                f"{self._api_base('anthropic')}/v1/messages",
                 headers=headers,
                 json=payload,
                 timeout=10
@@ -163,7 +178,7 @@ Guidelines:
 - priority: Critical if urgent/blocking, High if important, Medium if normal, Low if minor
 """
 
-            url = f"https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash:generateContent?key={self.api_key}"
+            url = f"{self._api_base('gemini')}/v1/models/gemini-1.5-flash:generateContent?key={self.api_key}"
             
             payload = {
                 "contents": [
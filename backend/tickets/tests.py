@@ -1,8 +1,14 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import openai
+
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from tickets.models import Ticket
+from tickets.llm_service import LLMService
 
 
 class TicketModelTest(TestCase):
@@ -60,3 +66,61 @@ class TicketAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('total_tickets', response.data)
         self.assertIn('priority_breakdown', response.data)
+
+
+class LLMServiceAPIBaseTest(TestCase):
+    @patch.dict(os.environ, {'LLM_API_KEY': 'fake-key', 'LLM_PROVIDER': 'anthropic',
+                             'LLM_API_BASE': 'http://fake-llm:8080/'})
+    @patch('tickets.llm_service.requests.post')
+    def test_api_base_override(self, mock_post):
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {
+            'content': [{'text': '{"category": "billing", "priority": "high"}'}]
+        }
+        result = LLMService().classify_ticket("I was charged twice")
+        self.assertEqual(result, ('billing', 'high'))
+        self.assertEqual(mock_post.call_args[0][0], 'http://fake-llm:8080/v1/messages')
+
+    @patch.dict(os.environ, {'LLM_API_BASE': ''})
+    def test_default_api_base(self):
+        self.assertEqual(LLMService()._api_base('anthropic'), 'https://api.anthropic.com')
+        self.assertEqual(LLMService()._api_base('gemini'), 'https://generativelanguage.googleapis.com')
+
+    @patch.dict(os.environ, {'LLM_API_KEY': 'fake-key', 'LLM_PROVIDER': 'gemini',
+                             'LLM_API_BASE': 'http://fake-llm:8080'})
+    @patch('tickets.llm_service.requests.post')
+    def test_gemini_api_base_override(self, mock_post):
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {
+            'candidates': [{'content': {'parts': [{'text': '{"category": "account", "priority": "low"}'}]}}]
+        }
+        result = LLMService().classify_ticket("Update my profile")
+        self.assertEqual(result, ('account', 'low'))
+        self.assertEqual(
+            mock_post.call_args[0][0],
+            'http://fake-llm:8080/v1/models/gemini-1.5-flash:generateContent?key=fake-key'
+        )
+
+    def _openai_response(self):
+        message = MagicMock(content='{"category": "technical", "priority": "critical"}')
+        return MagicMock(choices=[MagicMock(message=message)])
+
+    @patch.dict(os.environ, {'LLM_API_KEY': 'fake-key', 'LLM_PROVIDER': 'openai',
+                             'LLM_API_BASE': 'http://fake-llm:8080/'})
+    @patch('openai.ChatCompletion.create')
+    def test_openai_api_base_override(self, mock_create):
+        mock_create.return_value = self._openai_response()
+        with patch.object(openai, 'api_base', 'https://api.openai.com/v1'):
+            result = LLMService().classify_ticket("The app crashes")
+            self.assertEqual(openai.api_base, 'http://fake-llm:8080/v1')
+        self.assertEqual(result, ('technical', 'critical'))
+
+    @patch.dict(os.environ, {'LLM_API_KEY': 'fake-key', 'LLM_PROVIDER': 'openai',
+                             'LLM_API_BASE': ''})
+    @patch('openai.ChatCompletion.create')
+    def test_openai_api_base_untouched_by_default(self, mock_create):
+        mock_create.return_value = self._openai_response()
+        # e.g. a proxy configured through OPENAI_API_BASE must survive
+        with patch.object(openai, 'api_base', 'https://proxy.example.com/v1'):
+            LLMService().classify_ticket("The app crashes")
+            self.assertEqual(openai.api_base, 'https://proxy.example.com/v1')
@@ -0,0 +1,271 @@
+"""
+Fake LLM provider for offline load testing.
+
+Speaks the request/response shapes used by tickets/llm_service.py:
+- OpenAI:    POST /v1/chat/completions
+- Anthropic: POST /v1/messages
+- Gemini:    POST /v1/models/<model>:generateContent
+
+Point the API at it with LLM_API_BASE=http://fake-llm:8080 and any non-empty
+LLM_API_KEY. Behaviour is configured through environment variables:
+
+FAKE_LLM_PORT              Port to listen on (default 8080)
+FAKE_LLM_LATENCY           Latency distribution: fixed, uniform, normal,
+                           lognormal or exponential (default lognormal)
+FAKE_LLM_LATENCY_MS        Mean latency in milliseconds (default 400)
+FAKE_LLM_LATENCY_STDDEV_MS Standard deviation for uniform/normal/lognormal
+                           (default 150)
+FAKE_LLM_ERROR_RATE        Fraction of requests answered with an error (default 0)
+FAKE_LLM_ERROR_STATUS      HTTP status used for errors (default 500)
+FAKE_LLM_SEED              Optional random seed for reproducible runs
+"""
+import json
+import math
+import os
+import random
+import re
+import time
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+logger = logging.getLogger('fake_llm')
+
+CATEGORY_KEYWORDS = {
+    'billing': ['bill', 'invoice', 'charge', 'payment', 'refund', 'subscription'],
+    'account': ['login', 'password', 'account', 'access', 'profile', 'locked'],
+    'technical': ['error', 'bug', 'crash', 'slow', 'broken', 'api', 'feature'],
+}
+
+PRIORITY_KEYWORDS = {
+    'critical': ['urgent', 'outage', 'down', 'blocking', 'data loss'],
+    'high': ['cannot', "can't", 'unable', 'broken', 'crash'],
+    'low': ['question', 'minor', 'suggestion', 'typo'],
+}
+
+GEMINI_PATH = re.compile(r'^/v1(beta)?/models/[^/:]+:generateContent$')
+
+LATENCY_DISTRIBUTIONS = {'fixed', 'uniform', 'normal', 'lognormal', 'exponential'}
+
+
+class LatencyModel:
+    def __init__(self, distribution: str, mean_ms: float, stddev_ms: float, rng: random.Random):
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution: {distribution} "
+                f"(expected one of {', '.join(sorted(LATENCY_DISTRIBUTIONS))})"
+            )
+        self.distribution = distribution
+        self.mean = mean_ms / 1000.0
+        self.stddev = stddev_ms / 1000.0
+        self.rng = rng
+
+    def sample(self) -> float:
+        """Return a latency in seconds drawn from the configured distribution"""
+        if self.mean <= 0:
+            return 0.0
+        if self.distribution == 'fixed':
+            return self.mean
+        if self.distribution == 'uniform':
+            # A half-width of stddev * sqrt(3) gives the requested standard deviation
+            half_width = self.stddev * math.sqrt(3)
+            return max(self.rng.uniform(self.mean - half_width, self.mean + half_width), 0.0)
+        if self.distribution == 'normal':
+            return max(self.rng.gauss(self.mean, self.stddev), 0.0)
+        if self.distribution == 'exponential':
+            return self.rng.expovariate(1.0 / self.mean)
+        if self.distribution == 'lognormal':
+            # Parameterise the underlying normal so the samples keep the requested mean/stddev
+            sigma2 = math.log(1 + (self.stddev / self.mean) ** 2)
+            mu = math.log(self.mean) - sigma2 / 2
+            return self.rng.lognormvariate(mu, math.sqrt(sigma2))
+        raise ValueError(f"Unknown latency distribution: {self.distribution}")
+
+
+def classify(text: str) -> Tuple[str, str]:
+    """Keyword-based stand-in for the model so responses vary realistically"""
+    text = text.lower()
+    category = 'general'
+    for name, keywords in CATEGORY_KEYWORDS.items():
+        if any(keyword in text for keyword in keywords):
+            category = name
+            break
+    priority = 'medium'
+    for name, keywords in PRIORITY_KEYWORDS.items():
+        if any(keyword in text for keyword in keywords):
+            priority = name
+            break
+    return (category, priority)
+
+
+def extract_description(prompt: str) -> str:
+    """Pull the ticket description out of the classification prompt"""
+    match = re.search(r'Description:(.*?)Respond with', prompt, re.S)
+    return match.group(1) if match else prompt
+
+
+def openai_response(body: dict, result: str) -> Tuple[int, dict]:
+    return 200, {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "gpt-3.5-turbo"),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": result},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+def anthropic_response(body: dict, result: str) -> Tuple[int, dict]:
+    return 200, {
+        "id": "msg_fake",
+        "type": "message",
+        "role": "assistant",
+        "model": body.get("model", "claude-haiku"),
+        "content": [{"type": "text", "text": result}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 0, "output_tokens": 0},
+    }
+
+
+def gemini_response(body: dict, result: str) -> Tuple[int, dict]:
+    return 200, {
+        "candidates": [
+            {
+                "content": {"role": "model", "parts": [{"text": result}]},
+                "finishReason": "STOP",
+                "index": 0,
+            }
+        ],
+    }
+
+
+def prompt_text(path: str, body: dict) -> str:
+    """Return the user prompt from any of the supported request shapes"""
+    if GEMINI_PATH.match(path):
+        return body["contents"][0]["parts"][0]["text"]
+    content = body["messages"][-1]["content"]
+    if isinstance(content, list):
+        content = " ".join(part.get("text", "") for part in content)
+    return content
+
+
+def error_body(path: str, status_code: int) -> dict:
+    message = f"Injected fake LLM error ({status_code})"
+    if path == '/v1/messages':
+        return {"type": "error", "error": {"type": "api_error", "message": message}}
+    if GEMINI_PATH.match(path):
+        return {"error": {"code": status_code, "message": message, "status": "INTERNAL"}}
+    return {"error": {"message": message, "type": "server_error", "code": None}}
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    server_version = 'FakeLLM/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path: {self.path}"}})
+
+    def do_POST(self):
+        # Always drain the body first so a keep-alive connection stays in sync
+        length = int(self.headers.get('Content-Length', 0))
+        raw_body = self.rfile.read(length)
+
+        path = self.path.split('?', 1)[0]
+        if path == '/v1/chat/completions':
+            builder = openai_response
+        elif path == '/v1/messages':
+            builder = anthropic_response
+        elif GEMINI_PATH.match(path):
+            builder = gemini_response
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path: {path}"}})
+            return
+
+        try:
+            body = json.loads(raw_body or b'{}')
+            prompt = prompt_text(path, body)
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            self._send_json(400, {"error": {"message": f"Malformed request: {e}"}})
+            return
+
+        config = self.server.config
+        time.sleep(config['latency'].sample())
+
+        if config['rng'].random() < config['error_rate']:
+            self._send_json(config['error_status'], error_body(path, config['error_status']))
+            return
+
+        category, priority = classify(extract_description(prompt))
+        result = json.dumps({"category": category, "priority": priority})
+        self._send_json(*builder(body, result))
+
+    def _send_json(self, status_code: int, payload: dict):
+        data = json.dumps(payload).encode()
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def build_server(host: str = '0.0.0.0', port: int = 8080) -> ThreadingHTTPServer:
+    """Create the fake provider server configured from environment variables"""
+    seed = os.getenv('FAKE_LLM_SEED')
+    rng = random.Random(int(seed) if seed else None)
+    # Validate everything before binding so a bad setting fails at startup, not per request
+    config = {
+        'rng': rng,
+        'latency': LatencyModel(
+            os.getenv('FAKE_LLM_LATENCY', 'lognormal').lower(),
+            float(os.getenv('FAKE_LLM_LATENCY_MS', '400')),
+            float(os.getenv('FAKE_LLM_LATENCY_STDDEV_MS', '150')),
+            rng,
+        ),
+        'error_rate': float(os.getenv('FAKE_LLM_ERROR_RATE', '0')),
+        'error_status': int(os.getenv('FAKE_LLM_ERROR_STATUS', '500')),
+    }
+    if not 0 <= config['error_rate'] <= 1:
+        raise ValueError(f"FAKE_LLM_ERROR_RATE must be between 0 and 1, got {config['error_rate']}")
+
+    server = ThreadingHTTPServer((host, port), FakeLLMHandler)
+    server.daemon_threads = True
+    server.config = config
+    return server
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(message)s')
+    port = int(os.getenv('FAKE_LLM_PORT', '8080'))
+    try:
+        server = build_server(port=port)
+    except ValueError as e:
+        raise SystemExit(f"Invalid fake LLM configuration: {e}")
+    latency = server.config['latency']
+    logger.info(
+        f"Fake LLM listening on :{port} (latency={latency.distribution} "
+        f"mean={latency.mean * 1000:.0f}ms stddev={latency.stddev * 1000:.0f}ms, "
+        f"error_rate={server.config['error_rate']})"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
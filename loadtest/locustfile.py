@@ -0,0 +1,133 @@
+"""
+Mixed create/list/search/stats workload for the tickets API.
+
+Task weights can be overridden with LOADTEST_WEIGHTS, e.g.
+LOADTEST_WEIGHTS="create=1,list=5,search=3,stats=2". Each endpoint is
+reported under its own name so Locust's CSV/console output gives
+throughput and latency percentiles per endpoint.
+"""
+import os
+import random
+import time
+import logging
+
+import requests
+from locust import HttpUser, between, events
+from locust.runners import WorkerRunner
+
+logger = logging.getLogger(__name__)
+
+TITLES = [
+    "Cannot login to my account",
+    "Charged twice on my last invoice",
+    "App crashes when uploading files",
+    "Question about changing my profile email",
+    "Urgent: production API is down",
+    "Refund for cancelled subscription",
+    "Password reset email never arrives",
+    "Dashboard is very slow to load",
+    "Minor typo on the pricing page",
+    "Feature request: export tickets to CSV",
+]
+
+DESCRIPTIONS = [
+    "I am unable to access my account since this morning, it says my password is wrong.",
+    "My billing statement shows an extra charge for this month that I did not authorize.",
+    "Every time I try to upload a file bigger than 10MB the app crashes with an error.",
+    "This is a minor question about where to update the details on my profile.",
+    "Our whole team is blocked, the API returns 500 for every request. This is an outage.",
+    "I cancelled my subscription last week and would like a refund for the remaining days.",
+    "I requested a password reset several times but the email never shows up.",
+    "The stats dashboard takes over ten seconds to load, it used to be fast.",
+]
+
+SEARCH_TERMS = ["login", "invoice", "crash", "refund", "password", "slow", "api", "profile"]
+CATEGORIES = ["billing", "technical", "account", "general"]
+PRIORITIES = ["low", "medium", "high", "critical"]
+STATUSES = ["open", "in_progress", "resolved", "closed"]
+
+DEFAULT_WEIGHTS = {'create': 1, 'list': 5, 'search': 3, 'stats': 2}
+
+
+def load_weights():
+    """Parse LOADTEST_WEIGHTS into a {task_name: weight} dict"""
+    weights = dict(DEFAULT_WEIGHTS)
+    raw = os.getenv('LOADTEST_WEIGHTS', '')
+    for item in filter(None, (part.strip() for part in raw.split(','))):
+        name, sep, value = (part.strip() for part in item.partition('='))
+        if name not in weights:
+            raise ValueError(f"Unknown task in LOADTEST_WEIGHTS: {name}")
+        if not sep or not value.isdigit():
+            raise ValueError(
+                f"Invalid weight in LOADTEST_WEIGHTS: {item!r} (expected {name}=<non-negative integer>)"
+            )
+        weights[name] = int(value)
+    return weights
+
+
+def create_ticket(user):
+    payload = {
+        'title': random.choice(TITLES),
+        'description': random.choice(DESCRIPTIONS),
+        'category': random.choice(CATEGORIES),
+        'priority': random.choice(PRIORITIES),
+    }
+    user.client.post('/api/tickets/', json=payload, name='create /api/tickets/')
+
+
+def list_tickets(user):
+    params = {}
+    # Mirror the frontend: most list views are unfiltered, some use one or more filters
+    if random.random() < 0.5:
+        params['category'] = random.choice(CATEGORIES)
+    if random.random() < 0.3:
+        params['priority'] = random.choice(PRIORITIES)
+    if random.random() < 0.3:
+        params['status'] = random.choice(STATUSES)
+    user.client.get('/api/tickets/', params=params, name='list /api/tickets/')
+
+
+def search_tickets(user):
+    params = {'search': random.choice(SEARCH_TERMS)}
+    user.client.get('/api/tickets/', params=params, name='search /api/tickets/?search=')
+
+
+def get_stats(user):
+    user.client.get('/api/tickets/stats/', name='stats /api/tickets/stats/')
+
+
+TASKS = {
+    'create': create_ticket,
+    'list': list_tickets,
+    'search': search_tickets,
+    'stats': get_stats,
+}
+
+
+@events.init.add_listener
+def wait_for_api(environment, **kwargs):
+    """
+    Block until the API answers so startup (migrations) isn't measured as errors.
+    Runs on init rather than test_start so the wait doesn't eat into --run-time.
+    """
+    if isinstance(environment.runner, WorkerRunner) or not environment.host:
+        return
+    url = f"{environment.host}/api/tickets/stats/"
+    deadline = time.time() + float(os.getenv('LOADTEST_STARTUP_TIMEOUT', '120'))
+    while time.time() < deadline:
+        try:
+            if requests.get(url, timeout=5).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        logger.info(f"Waiting for API at {url}...")
+        time.sleep(2)
+    logger.warning(f"API at {url} not ready, starting load test anyway")
+
+
+class TicketUser(HttpUser):
+    wait_time = between(
+        float(os.getenv('LOADTEST_WAIT_MIN', '0.5')),
+        float(os.getenv('LOADTEST_WAIT_MAX', '2')),
+    )
+    tasks = {TASKS[name]: weight for name, weight in load_weights().items() if weight > 0}
@@ -0,0 +1,155 @@
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from importlib.util import find_spec
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+import fake_llm
+from tickets.llm_service import LLMService
+
+PROMPT = (
+    "Analyze this support ticket description and classify it.\n\n"
+    "Description: Urgent: I was charged twice on my invoice\n\n"
+    "Respond with ONLY a JSON object"
+)
+
+
+def start_server(test, **env):
+    """Start a fake provider on a free port for the duration of test"""
+    settings = {'FAKE_LLM_LATENCY': 'fixed', 'FAKE_LLM_LATENCY_MS': '0', 'FAKE_LLM_SEED': '1'}
+    settings.update(env)
+    with patch.dict(os.environ, settings):
+        server = fake_llm.build_server('127.0.0.1', 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    test.addCleanup(server.server_close)
+    test.addCleanup(server.shutdown)
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def post_json(url, body):
+    request = urllib.request.Request(url, json.dumps(body).encode(), {'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+class LatencyModelTest(unittest.TestCase):
+    def sample(self, distribution, mean_ms=400, stddev_ms=150, n=20000):
+        model = fake_llm.LatencyModel(distribution, mean_ms, stddev_ms, random.Random(1))
+        return [model.sample() for _ in range(n)]
+
+    def test_unknown_distribution_rejected(self):
+        with self.assertRaises(ValueError):
+            fake_llm.LatencyModel('gaussian', 400, 150, random.Random(1))
+
+    def test_fixed(self):
+        self.assertEqual(set(self.sample('fixed', n=10)), {0.4})
+
+    def test_mean_and_stddev(self):
+        for distribution in ['uniform', 'normal', 'lognormal']:
+            samples = self.sample(distribution)
+            self.assertAlmostEqual(statistics.mean(samples), 0.4, delta=0.01, msg=distribution)
+            self.assertAlmostEqual(statistics.stdev(samples), 0.15, delta=0.01, msg=distribution)
+
+    def test_exponential_mean(self):
+        self.assertAlmostEqual(statistics.mean(self.sample('exponential')), 0.4, delta=0.02)
+
+    def test_zero_mean_has_no_latency(self):
+        self.assertEqual(set(self.sample('lognormal', mean_ms=0, n=10)), {0.0})
+
+
+class BuildServerTest(unittest.TestCase):
+    def test_invalid_settings_rejected(self):
+        for env in [{'FAKE_LLM_LATENCY': 'gaussian'}, {'FAKE_LLM_ERROR_RATE': '1.5'},
+                    {'FAKE_LLM_ERROR_RATE': '-0.1'}]:
+            with patch.dict(os.environ, env), self.assertRaises(ValueError, msg=env):
+                fake_llm.build_server('127.0.0.1', 0)
+
+
+class PromptTextTest(unittest.TestCase):
+    def test_request_shapes(self):
+        self.assertEqual(
+            fake_llm.prompt_text('/v1/chat/completions', {'messages': [{'role': 'user', 'content': 'hi'}]}),
+            'hi'
+        )
+        self.assertEqual(
+            fake_llm.prompt_text('/v1/messages', {'messages': [
+                {'role': 'user', 'content': [{'type': 'text', 'text': 'a'}, {'type': 'text', 'text': 'b'}]}
+            ]}),
+            'a b'
+        )
+        self.assertEqual(
+            fake_llm.prompt_text('/v1/models/gemini-1.5-flash:generateContent',
+                                 {'contents': [{'parts': [{'text': 'hi'}]}]}),
+            'hi'
+        )
+
+    def test_classify_uses_description_only(self):
+        self.assertEqual(fake_llm.classify(fake_llm.extract_description(PROMPT)), ('billing', 'critical'))
+
+
+class FakeLLMServerTest(unittest.TestCase):
+    def test_gemini_path_with_query_string(self):
+        base = start_server(self)
+        status, body = post_json(
+            f"{base}/v1/models/gemini-1.5-flash:generateContent?key=fake-key",
+            {'contents': [{'parts': [{'text': PROMPT}]}]}
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body['candidates'][0]['content']['parts'][0]['text']),
+                         {'category': 'billing', 'priority': 'critical'})
+
+    def test_unknown_path(self):
+        base = start_server(self)
+        status, _ = post_json(f"{base}/v1/unknown", {})
+        self.assertEqual(status, 404)
+
+    def test_error_injection(self):
+        base = start_server(self, FAKE_LLM_ERROR_RATE='1', FAKE_LLM_ERROR_STATUS='429')
+        status, body = post_json(f"{base}/v1/messages", {'messages': [{'role': 'user', 'content': PROMPT}]})
+        self.assertEqual(status, 429)
+        self.assertEqual(body['type'], 'error')
+
+
+class LLMServiceAgainstFakeLLMTest(unittest.TestCase):
+    """Check that LLMService can parse what the fake provider returns"""
+
+    def classify(self, base, provider):
+        env = {'LLM_API_KEY': 'fake-key', 'LLM_PROVIDER': provider, 'LLM_API_BASE': base}
+        with patch.dict(os.environ, env):
+            return LLMService().classify_ticket("Urgent: I was charged twice on my invoice")
+
+    @unittest.skipUnless(find_spec('openai'), "openai is not installed")
+    def test_openai(self):
+        import openai
+        base = start_server(self)
+        with patch.object(openai, 'api_base', openai.api_base):
+            self.assertEqual(self.classify(base, 'openai'), ('billing', 'critical'))
+
+    def test_anthropic(self):
+        base = start_server(self)
+        self.assertEqual(self.classify(base, 'anthropic'), ('billing', 'critical'))
+
+    def test_gemini(self):
+        base = start_server(self)
+        self.assertEqual(self.classify(base, 'gemini'), ('billing', 'critical'))
+
+    def test_injected_errors_fall_back_to_defaults(self):
+        base = start_server(self, FAKE_LLM_ERROR_RATE='1')
+        for provider in ['anthropic', 'gemini']:
+            self.assertEqual(self.classify(base, provider), ('general', 'medium'), msg=provider)
+
+
+if __name__ == '__main__':
+    unittest.main()